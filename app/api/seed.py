@@ -13,8 +13,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.db.session import engine, get_session
-from app.models.base import Base
+from app.db.session import get_session, init_db
 from app.models.document import Document
 from app.models.event import Event
 from app.models.event_doc import EventDoc
@@ -349,9 +348,8 @@ async def seed_reddit_data(session: AsyncSession = Depends(get_session)):
     brand = "Trip.com"
     today = date.today()
 
-    # Ensure tables exist, then clean all data using the same session
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Ensure tables exist (and are upgraded), then clean all data using the same session
+    await init_db()
     await session.execute(text("DELETE FROM daily_aspect_metrics"))
     await session.execute(text("DELETE FROM daily_metrics"))
     await session.execute(text("DELETE FROM event_docs"))
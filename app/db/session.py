@@ -1,10 +1,15 @@
+import json
+import logging
 import os
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import Connection, inspect, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
 # Ensure data directory exists (skip on Vercel — uses /tmp)
 if not os.environ.get("VERCEL"):
     _data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data")
@@ -20,7 +25,74 @@ async def get_session() -> AsyncGenerator[AsyncSession]:
 
 
 async def init_db() -> None:
-    """Create all tables if they don't exist."""
+    """Create all tables if they don't exist, then upgrade older schemas in place."""
     from app.models import Base
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(upgrade_schema)
+
+
+# Columns added to existing tables after their first release; create_all
+# only creates missing tables, so these are added with ALTER TABLE.
+_ADDED_COLUMNS: dict[str, dict[str, str]] = {
+    "documents": {
+        "embedding_bytes": "BLOB",
+        "embedding_i8": "BLOB",
+        "embedding_scale": "FLOAT",
+    },
+}
+
+
+def upgrade_schema(conn: Connection) -> None:
+    """Add columns and indexes missing from a database created by an older release."""
+    inspector = inspect(conn)
+    for table, columns in _ADDED_COLUMNS.items():
+        existing = {col["name"] for col in inspector.get_columns(table)}
+        for name, ddl_type in columns.items():
+            if name not in existing:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl_type}"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS idx_docs_created_at ON documents (created_at)"))
+
+    if "embedding_json" in {col["name"] for col in inspect(conn).get_columns("documents")}:
+        _backfill_embeddings(conn)
+
+
+def _backfill_embeddings(conn: Connection) -> None:
+    """Convert legacy embedding_json vectors into the embedding_bytes/i8/scale columns.
+
+    Goes through Document.embedding so backfilled rows are unit-normalized and
+    quantized exactly like new writes. Only rows not yet converted are touched.
+    """
+    rows = conn.execute(text(
+        "SELECT doc_id, embedding_json FROM documents "
+        "WHERE embedding_json IS NOT NULL AND embedding_bytes IS NULL"
+    )).all()
+    if not rows:
+        return
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        # numpy ships with the ml extra only (not on Vercel); retry on a full install
+        logger.warning("Skipped backfilling %d legacy embeddings: numpy is not installed", len(rows))
+        return
+
+    from app.models.document import Document
+
+    params = []
+    for doc_id, embedding_json in rows:
+        doc = Document(embedding=json.loads(embedding_json))
+        params.append({
+            "doc_id": doc_id,
+            "embedding_bytes": doc.embedding_bytes,
+            "embedding_i8": doc.embedding_i8,
+            "embedding_scale": doc.embedding_scale,
+        })
+    conn.execute(
+        text(
+            "UPDATE documents SET embedding_bytes = :embedding_bytes, embedding_i8 = :embedding_i8, "
+            "embedding_scale = :embedding_scale WHERE doc_id = :doc_id"
+        ),
+        params,
+    )
+    logger.info("Backfilled %d legacy embeddings from embedding_json", len(params))
@@ -9,11 +9,14 @@ logger = logging.getLogger(__name__)
 
 
 def cluster_embeddings(
-    embeddings: list[list[float]],
+    embeddings: np.ndarray | list[list[float]],
     doc_ids: list[str],
 ) -> list[dict]:
     """Cluster documents by embedding similarity using DBSCAN.
 
+    ``embeddings`` is an (N, D) matrix, or a list of N vectors, aligned with ``doc_ids``.
+    Vectors must already be unit-normalized (Document.embedding stores them so).
+
     Returns a list of clusters, each with:
         - cluster_id: int
         - doc_ids: list[str]
@@ -22,21 +25,26 @@ def cluster_embeddings(
     if len(embeddings) < settings.MIN_CLUSTER_SIZE:
         return []
 
-    matrix = np.array(embeddings, dtype=np.float32)
+    normalized = np.asarray(embeddings, dtype=np.float32)
 
-    # Normalize for cosine-like behavior with euclidean distance
-    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
-    norms[norms == 0] = 1
-    normalized = matrix / norms
+    # Full cosine-distance matrix in one GEMM, finished in place so only a
+    # single N x N buffer is allocated; clip float error below zero
+    dist = normalized @ normalized.T
+    np.subtract(1.0, dist, out=dist)
+    np.maximum(dist, 0.0, out=dist)
+    np.fill_diagonal(dist, 0.0)
 
-    # eps=0.55 on normalized vectors ≈ cosine_similarity threshold of 0.85
-    # (cosine_distance = 1 - sim; euclidean on unit vectors ≈ sqrt(2 * cosine_distance))
+    # eps=0.15 cosine distance ≈ cosine_similarity threshold of 0.85
+    # (same neighbourhood as the former eps=0.55 euclidean on unit vectors).
+    # Brute-force neighbour lookup over the matrix, parallel across cores.
     clusterer = DBSCAN(
-        eps=0.55,
+        eps=0.15,
         min_samples=settings.MIN_CLUSTER_SIZE,
-        metric="euclidean",
+        metric="precomputed",
+        algorithm="brute",
+        n_jobs=-1,
     )
-    labels = clusterer.fit_predict(normalized)
+    labels = clusterer.fit_predict(dist)
 
     # Group by cluster label (ignore noise: label == -1)
     clusters_map: dict[int, list[int]] = {}
@@ -12,41 +12,57 @@ from app.models.event_doc import EventDoc
 
 logger = logging.getLogger(__name__)
 
+# Int8 screening error on cosine is well under this; candidates within the
+# margin of the threshold are confirmed against the float32 centroid.
+_I8_SCREEN_MARGIN = 0.02
 
-async def get_active_events(brand: str, session: AsyncSession) -> list[Event]:
-    """Get events within the 12h lifecycle window for a brand."""
+
+async def get_active_events(brands: list[str], session: AsyncSession) -> dict[str, list[Event]]:
+    """Get events within the 12h lifecycle window for several brands in one query.
+
+    Returns a mapping of brand -> active events (brands without events are omitted).
+    """
     cutoff = datetime.now(timezone.utc) - timedelta(hours=settings.EVENT_LIFECYCLE_HOURS)
     stmt = (
         select(Event)
-        .where(Event.brand == brand)
+        .where(Event.brand.in_(brands))
         .where(Event.status.in_(["open", "monitoring", "cooling"]))
         .where(Event.last_update_time >= cutoff)
     )
     result = await session.execute(stmt)
-    return list(result.scalars().all())
+    events_by_brand: dict[str, list[Event]] = {}
+    for event in result.scalars().all():
+        events_by_brand.setdefault(event.brand, []).append(event)
+    return events_by_brand
 
 
-async def get_event_centroid(event_id: str, session: AsyncSession) -> np.ndarray | None:
-    """Compute the centroid embedding of an event's documents."""
+async def get_event_centroids(event_ids: list[str], session: AsyncSession) -> dict[str, np.ndarray]:
+    """Compute unit-normalized float32 centroids for several events in one query.
+
+    Events without embedded documents are omitted.
+    """
     stmt = (
-        select(Document.embedding)
-        .join(EventDoc, EventDoc.doc_id == Document.doc_id)
-        .where(EventDoc.event_id == event_id)
+        select(EventDoc.event_id, Document.embedding_bytes)
+        .join(Document, Document.doc_id == EventDoc.doc_id)
+        .where(EventDoc.event_id.in_(event_ids))
+        .where(Document.embedding_bytes.isnot(None))
     )
     result = await session.execute(stmt)
-    embeddings = [row[0] for row in result.all() if row[0] is not None]
-    if not embeddings:
-        return None
-    return np.mean(np.array(embeddings), axis=0)
+    groups: dict[str, list[bytes]] = {}
+    for event_id, embedding_bytes in result.all():
+        groups.setdefault(event_id, []).append(embedding_bytes)
+
+    centroids: dict[str, np.ndarray] = {}
+    for event_id, blobs in groups.items():
+        # Decode straight into one contiguous (n, D) float32 matrix
+        centroid = np.frombuffer(b"".join(blobs), dtype=np.float32).reshape(len(blobs), -1).mean(axis=0)
+        centroids[event_id] = centroid / max(float(np.linalg.norm(centroid)), 1e-12)
+    return centroids
 
 
 def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
-    """Compute cosine similarity between two vectors."""
-    norm_a = np.linalg.norm(a)
-    norm_b = np.linalg.norm(b)
-    if norm_a == 0 or norm_b == 0:
-        return 0.0
-    return float(np.dot(a, b) / (norm_a * norm_b))
+    """Compute cosine similarity between two unit-normalized vectors."""
+    return float(np.dot(a, b))
 
 
 async def find_matching_event(
@@ -64,20 +80,67 @@ async def find_matching_event(
     # (flight_number, airline+route, policy_country+policy_type, system_error keyword)
     # These would require document metadata fields; for now rely on embedding similarity.
 
-    best_match: Event | None = None
-    best_sim = 0.0
+    if not active_events:
+        return None
 
-    for event in active_events:
-        event_centroid = await get_event_centroid(event.event_id, session)
-        if event_centroid is None:
-            continue
+    # Screen with the int8 embeddings: fetch every active event's docs in one query
+    stmt = (
+        select(EventDoc.event_id, Document.embedding_i8, Document.embedding_scale)
+        .join(Document, Document.doc_id == EventDoc.doc_id)
+        .where(EventDoc.event_id.in_([e.event_id for e in active_events]))
+        .where(Document.embedding_i8.isnot(None))
+    )
+    result = await session.execute(stmt)
+    groups: dict[str, tuple[list[bytes], list[float]]] = {}
+    for event_id, embedding_i8, scale in result.all():
+        blobs, scales = groups.setdefault(event_id, ([], []))
+        blobs.append(embedding_i8)
+        scales.append(scale)
+
+    # Most recently updated first, so equal similarities resolve to the newest event
+    candidates = sorted(
+        (e for e in active_events if e.event_id in groups),
+        key=lambda e: e.last_update_time,
+        reverse=True,
+    )
+    if not candidates:
+        return None
 
-        sim = cosine_similarity(cluster_centroid, event_centroid)
-        if sim >= settings.EMBEDDING_SIM_THRESHOLD and sim > best_sim:
-            best_sim = sim
-            best_match = event
+    # Dequantized centroid per event: (scales @ Q) / n
+    centroids = np.stack([_i8_centroid(*groups[e.event_id]) for e in candidates])
+
+    # Unit-normalize centroids and query once; cosine is then a single GEMV
+    centroids /= np.linalg.norm(centroids, axis=1, keepdims=True).clip(min=1e-12)
+    query = np.asarray(cluster_centroid, dtype=np.float32)
+    query = query / max(float(np.linalg.norm(query)), 1e-12)
+    sims = centroids @ query
+
+    # Re-score every candidate within the screening margin against its exact
+    # float32 centroid (one query) and take the best. Candidates stay in recency
+    # order, so argmax resolves ties to the most recently updated event.
+    shortlist = [
+        candidates[i] for i in np.flatnonzero(sims >= settings.EMBEDDING_SIM_THRESHOLD - _I8_SCREEN_MARGIN)
+    ]
+    if not shortlist:
+        return None
 
-    if best_match:
-        logger.info("Matched cluster to event %s (sim=%.3f)", best_match.event_id, best_sim)
+    exact_centroids = await get_event_centroids([e.event_id for e in shortlist], session)
+    shortlist = [e for e in shortlist if e.event_id in exact_centroids]
+    if not shortlist:
+        return None
 
+    exact_sims = [cosine_similarity(query, exact_centroids[e.event_id]) for e in shortlist]
+    idx = int(np.argmax(exact_sims))
+    best_sim = exact_sims[idx]
+    if best_sim < settings.EMBEDDING_SIM_THRESHOLD:
+        return None
+
+    best_match = shortlist[idx]
+    logger.info("Matched cluster to event %s (sim=%.3f)", best_match.event_id, best_sim)
     return best_match
+
+
+def _i8_centroid(blobs: list[bytes], scales: list[float]) -> np.ndarray:
+    """Mean of int8-quantized vectors, dequantized to float32."""
+    quantized = np.frombuffer(b"".join(blobs), dtype=np.int8).reshape(len(blobs), -1)
+    return np.asarray(scales, dtype=np.float32) @ quantized.astype(np.float32) / len(blobs)
@@ -9,7 +9,8 @@ Runs once daily (00:00 UTC):
 import logging
 from datetime import date, datetime, timedelta, timezone
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import ColumnElement, case, func, select
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.document import Document
@@ -44,6 +45,9 @@ async def _aggregate_daily_metrics(
         select(
             Document.brand,
             func.count().label("volume_total"),
+            _count_where(Document.sentiment == "pos").label("pos_count"),
+            _count_where(Document.sentiment == "neu").label("neu_count"),
+            _count_where(Document.sentiment == "neg").label("neg_count"),
         )
         .where(Document.created_at >= day_start)
         .where(Document.created_at < day_end)
@@ -51,36 +55,27 @@ async def _aggregate_daily_metrics(
     )
     result = await session.execute(stmt)
 
-    for row in result.all():
-        brand = row.brand
-        # Count sentiments separately for SQLite compatibility
-        pos_q = await session.execute(
-            select(func.count()).where(
-                Document.brand == brand, Document.created_at >= day_start,
-                Document.created_at < day_end, Document.sentiment == "pos",
-            )
-        )
-        neu_q = await session.execute(
-            select(func.count()).where(
-                Document.brand == brand, Document.created_at >= day_start,
-                Document.created_at < day_end, Document.sentiment == "neu",
-            )
-        )
-        neg_q = await session.execute(
-            select(func.count()).where(
-                Document.brand == brand, Document.created_at >= day_start,
-                Document.created_at < day_end, Document.sentiment == "neg",
-            )
-        )
-
-        # Delete + insert (SQLite-compatible upsert)
-        await session.execute(
-            delete(DailyMetrics).where(DailyMetrics.brand == brand, DailyMetrics.date == target_date)
-        )
-        session.add(DailyMetrics(
-            date=target_date, brand=brand, volume_total=row.volume_total,
-            pos_count=pos_q.scalar() or 0, neu_count=neu_q.scalar() or 0, neg_count=neg_q.scalar() or 0,
-        ))
+    rows = [
+        {
+            "date": target_date, "brand": row.brand, "volume_total": row.volume_total,
+            "pos_count": row.pos_count or 0, "neu_count": row.neu_count or 0, "neg_count": row.neg_count or 0,
+        }
+        for row in result.all()
+    ]
+    if not rows:
+        return
+
+    # Single-statement upsert on the (brand, date) unique index
+    upsert = insert(DailyMetrics).values(rows)
+    await session.execute(upsert.on_conflict_do_update(
+        index_elements=["brand", "date"],
+        set_={
+            "volume_total": upsert.excluded.volume_total,
+            "pos_count": upsert.excluded.pos_count,
+            "neu_count": upsert.excluded.neu_count,
+            "neg_count": upsert.excluded.neg_count,
+        },
+    ))
 
 
 async def _aggregate_aspect_metrics(
@@ -91,7 +86,12 @@ async def _aggregate_aspect_metrics(
 ) -> None:
     """Aggregate volume and negative counts per brand+aspect."""
     stmt = (
-        select(Document.brand, Document.aspect, func.count().label("volume"))
+        select(
+            Document.brand,
+            Document.aspect,
+            func.count().label("volume"),
+            _count_where(Document.sentiment == "neg").label("neg_count"),
+        )
         .where(Document.created_at >= day_start)
         .where(Document.created_at < day_end)
         .where(Document.aspect.isnot(None))
@@ -99,22 +99,24 @@ async def _aggregate_aspect_metrics(
     )
     result = await session.execute(stmt)
 
-    for row in result.all():
-        neg_q = await session.execute(
-            select(func.count()).where(
-                Document.brand == row.brand, Document.aspect == row.aspect,
-                Document.created_at >= day_start, Document.created_at < day_end,
-                Document.sentiment == "neg",
-            )
-        )
-        await session.execute(
-            delete(DailyAspectMetrics).where(
-                DailyAspectMetrics.brand == row.brand,
-                DailyAspectMetrics.date == target_date,
-                DailyAspectMetrics.aspect == row.aspect,
-            )
-        )
-        session.add(DailyAspectMetrics(
-            date=target_date, brand=row.brand, aspect=row.aspect,
-            volume=row.volume, neg_count=neg_q.scalar() or 0,
-        ))
+    rows = [
+        {
+            "date": target_date, "brand": row.brand, "aspect": row.aspect,
+            "volume": row.volume, "neg_count": row.neg_count or 0,
+        }
+        for row in result.all()
+    ]
+    if not rows:
+        return
+
+    # Single-statement upsert on the (brand, date, aspect) unique index
+    upsert = insert(DailyAspectMetrics).values(rows)
+    await session.execute(upsert.on_conflict_do_update(
+        index_elements=["brand", "date", "aspect"],
+        set_={"volume": upsert.excluded.volume, "neg_count": upsert.excluded.neg_count},
+    ))
+
+
+def _count_where(condition: ColumnElement[bool]) -> ColumnElement[int]:
+    """Conditional COUNT usable inside a GROUP BY (portable to SQLite)."""
+    return func.sum(case((condition, 1), else_=0))
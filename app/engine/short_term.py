@@ -9,12 +9,16 @@ Runs every 30 minutes:
 6. Update event states
 """
 
+import asyncio
 import logging
+import multiprocessing
 import uuid
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select
+import numpy as np
+from sqlalchemy import Row, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -27,28 +31,69 @@ from app.models.event_doc import EventDoc
 
 logger = logging.getLogger(__name__)
 
+# Clustering is CPU-bound numpy/sklearn work; run it in a worker process so it
+# neither blocks the engine's event loop nor contends for the GIL. Brands are
+# processed one at a time, so a single worker suffices. The pool is created on
+# first use with forkserver (spawn where unavailable, e.g. Windows), never by
+# forking the multithreaded server process.
+_cluster_pool: ProcessPoolExecutor | None = None
+
+
+def _get_cluster_pool() -> ProcessPoolExecutor:
+    global _cluster_pool
+    if _cluster_pool is None:
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _cluster_pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context(method))
+    return _cluster_pool
+
+
+def shutdown_cluster_pool() -> None:
+    """Stop the clustering worker process, if one was started."""
+    global _cluster_pool
+    if _cluster_pool is not None:
+        _cluster_pool.shutdown(wait=False, cancel_futures=True)
+        _cluster_pool = None
+
 
 async def run_short_term_engine(session: AsyncSession) -> None:
     """Execute one cycle of the short-term event engine."""
     now = datetime.now(timezone.utc)
     window_start = now - timedelta(hours=settings.SHORT_TERM_AGG_WINDOW_HOURS)
 
-    # Fetch recent documents
-    stmt = select(Document).where(Document.created_at >= window_start)
+    # Fetch only the columns the engine needs; embeddings become one dense matrix
+    stmt = (
+        select(
+            Document.doc_id,
+            Document.brand,
+            Document.sentiment,
+            Document.region_group,
+            Document.embedding_bytes,
+        )
+        .where(Document.created_at >= window_start)
+        .where(Document.embedding_bytes.isnot(None))
+    )
     result = await session.execute(stmt)
-    docs = list(result.scalars().all())
+    rows = list(result.all())
 
-    if not docs:
-        logger.info("No documents in the last %dh window", settings.SHORT_TERM_AGG_WINDOW_HOURS)
+    if not rows:
+        logger.info("No embedded documents in the last %dh window", settings.SHORT_TERM_AGG_WINDOW_HOURS)
         return
 
-    # Group by brand
-    brands: dict[str, list[Document]] = {}
-    for doc in docs:
-        brands.setdefault(doc.brand, []).append(doc)
+    emb_matrix = np.frombuffer(
+        b"".join(row.embedding_bytes for row in rows), dtype=np.float32,
+    ).reshape(len(rows), -1)
+
+    # Group by brand: one vectorized pass over the brand column
+    brands, brand_idx = np.unique(np.array([row.brand for row in rows]), return_inverse=True)
 
-    for brand, brand_docs in brands.items():
-        await _process_brand(brand, brand_docs, session, now)
+    events_by_brand = await get_active_events(brands.tolist(), session)
+
+    for i, brand in enumerate(brands.tolist()):
+        indices = np.flatnonzero(brand_idx == i)
+        await _process_brand(
+            brand, [rows[j] for j in indices], emb_matrix[indices],
+            events_by_brand.get(brand, []), session, now,
+        )
 
     # Update lifecycle states for all events
     await _update_event_states(session, now)
@@ -57,34 +102,44 @@ async def run_short_term_engine(session: AsyncSession) -> None:
 
 async def _process_brand(
     brand: str,
-    docs: list[Document],
+    docs: list[Row],
+    embeddings: np.ndarray,
+    active_events: list[Event],
     session: AsyncSession,
     now: datetime,
 ) -> None:
-    """Process clustering and event matching for a single brand."""
-    embeddings = [doc.embedding for doc in docs if doc.embedding is not None]
-    doc_ids = [doc.doc_id for doc in docs if doc.embedding is not None]
+    """Process clustering and event matching for a single brand.
 
-    if len(embeddings) < settings.MIN_CLUSTER_SIZE:
+    ``docs`` are column rows (doc_id, sentiment, region_group, ...) aligned
+    with the rows of ``embeddings``; ``active_events`` are the brand's events
+    still inside the lifecycle window.
+    """
+    if len(docs) < settings.MIN_CLUSTER_SIZE:
         return
 
-    clusters = cluster_embeddings(embeddings, doc_ids)
+    clusters = await asyncio.get_running_loop().run_in_executor(
+        _get_cluster_pool(), cluster_embeddings, embeddings, [d.doc_id for d in docs],
+    )
     if not clusters:
         return
 
-    active_events = await get_active_events(brand, session)
+    doc_by_id = {d.doc_id: d for d in docs}
+    new_event_docs: list[EventDoc] = []
 
     for cluster in clusters:
         cluster_doc_ids = cluster["doc_ids"]
         centroid = cluster["centroid"]
 
-        # Gather cluster stats
-        cluster_docs = [d for d in docs if d.doc_id in set(cluster_doc_ids)]
-        neg_count = sum(1 for d in cluster_docs if d.sentiment == "neg")
+        # Gather cluster stats (negative count and region counts in one pass)
+        cluster_docs = [doc_by_id[doc_id] for doc_id in cluster_doc_ids]
+        neg_count = 0
+        region_counts: Counter[str] = Counter()
+        for d in cluster_docs:
+            neg_count += d.sentiment == "neg"
+            region_counts[d.region_group] += 1
         neg_ratio = neg_count / len(cluster_docs) if cluster_docs else 0.0
 
         # Determine dominant region
-        region_counts = Counter(d.region_group for d in cluster_docs)
         dominant_region = region_counts.most_common(1)[0][0] if region_counts else None
 
         # Try to match with existing event
@@ -98,15 +153,18 @@ async def _process_brand(
             matched_event.status = "monitoring"
             matched_event.severity = compute_severity(matched_event.cluster_size, neg_ratio)
 
-            for doc_id in cluster_doc_ids:
-                existing = await session.execute(
-                    select(EventDoc).where(
-                        EventDoc.event_id == matched_event.event_id,
-                        EventDoc.doc_id == doc_id,
-                    )
+            existing = await session.execute(
+                select(EventDoc.doc_id).where(
+                    EventDoc.event_id == matched_event.event_id,
+                    EventDoc.doc_id.in_(cluster_doc_ids),
                 )
-                if not existing.scalar_one_or_none():
-                    session.add(EventDoc(event_id=matched_event.event_id, doc_id=doc_id))
+            )
+            linked = set(existing.scalars().all())
+            new_event_docs.extend(
+                EventDoc(event_id=matched_event.event_id, doc_id=doc_id)
+                for doc_id in cluster_doc_ids
+                if doc_id not in linked
+            )
 
             logger.info("Merged %d docs into event %s", len(cluster_doc_ids), matched_event.event_id)
         else:
@@ -128,26 +186,38 @@ async def _process_brand(
             )
             session.add(event)
 
-            for doc_id in cluster_doc_ids:
-                session.add(EventDoc(event_id=event_id, doc_id=doc_id))
+            new_event_docs.extend(EventDoc(event_id=event_id, doc_id=doc_id) for doc_id in cluster_doc_ids)
 
             logger.info("Created new event %s (size=%d, severity=%s)", event_id, len(cluster_doc_ids), severity)
 
+    # One add_all so the flush emits a single multi-row INSERT (insertmanyvalues)
+    session.add_all(new_event_docs)
+
 
 async def _update_event_states(session: AsyncSession, now: datetime) -> None:
     """Update event lifecycle states: monitoring -> cooling -> closed."""
     cooling_cutoff = now - timedelta(hours=settings.EVENT_COOLING_THRESHOLD_HOURS)
     lifecycle_cutoff = now - timedelta(hours=settings.EVENT_LIFECYCLE_HOURS)
 
-    stmt = select(Event).where(Event.status.in_(["open", "monitoring", "cooling"]))
-    result = await session.execute(stmt)
-    events = result.scalars().all()
-
-    for event in events:
-        if event.last_update_time <= lifecycle_cutoff:
-            event.status = "closed"
-            logger.info("Event %s closed (lifecycle expired)", event.event_id)
-        elif event.last_update_time <= cooling_cutoff:
-            if event.status != "cooling":
-                event.status = "cooling"
-                logger.info("Event %s moved to cooling", event.event_id)
+    # synchronize_session=False: don't evaluate these WHEREs against Events
+    # already in the session (SQLite returns naive datetimes, the cutoffs are
+    # aware). Pending changes were autoflushed and the caller commits next.
+    closed = await session.execute(
+        update(Event)
+        .where(Event.status.in_(["open", "monitoring", "cooling"]))
+        .where(Event.last_update_time <= lifecycle_cutoff)
+        .values(status="closed")
+        .execution_options(synchronize_session=False)
+    )
+    if closed.rowcount:
+        logger.info("Closed %d events (lifecycle expired)", closed.rowcount)
+
+    cooled = await session.execute(
+        update(Event)
+        .where(Event.status.in_(["open", "monitoring"]))
+        .where(Event.last_update_time <= cooling_cutoff)
+        .values(status="cooling")
+        .execution_options(synchronize_session=False)
+    )
+    if cooled.rowcount:
+        logger.info("Moved %d events to cooling", cooled.rowcount)
@@ -4,6 +4,7 @@ from app.geo.mappings import get_region
 def classify_country(country_code: str) -> dict[str, str]:
     """Classify a country code into its region group.
 
+    Normalizes the code (uppercase, stripped) so it is stored canonically.
     Returns dict with country_code and region_group.
     """
     code = country_code.upper().strip()
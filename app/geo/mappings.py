@@ -1,9 +1,13 @@
 """ISO 3166-1 alpha-2 country code to region group mapping.
 
 Every country code must appear in exactly one group.
-Validated at startup via validate_no_duplicate_codes().
+Duplicates are rejected while building COUNTRY_TO_REGION (at import) and
+re-checked at startup via validate_no_duplicate_codes().
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 FEATURED = {
     "JP": "JAPAN",
     "KR": "KOREA",
@@ -25,38 +29,34 @@ FALLBACK_REGION = "ASIA_OTHER_UNMAPPED"
 
 
 def _build_country_to_region() -> dict[str, str]:
-    """Build a flat lookup: country_code -> region_group."""
+    """Build a flat lookup: country_code -> region_group.
+
+    Raises ValueError if any country code appears in more than one group.
+    """
     mapping: dict[str, str] = {}
     for code, region in FEATURED.items():
         mapping[code] = region
     for region, codes in REGION_GROUPS.items():
         for code in codes:
+            if code in mapping:
+                raise ValueError(
+                    f"Duplicate country code '{code}': found in '{mapping[code]}' and '{region}'"
+                )
             mapping[code] = region
     return mapping
 
 
-COUNTRY_TO_REGION: dict[str, str] = _build_country_to_region()
+COUNTRY_TO_REGION: Mapping[str, str] = MappingProxyType(_build_country_to_region())
 
 
 def get_region(country_code: str) -> str:
-    """Return the region group for a country code, or FALLBACK."""
-    return COUNTRY_TO_REGION.get(country_code.upper(), FALLBACK_REGION)
+    """Return the region group for a country code, or FALLBACK.
+
+    Expects a canonical (uppercase, stripped) code; see classify_country().
+    """
+    return COUNTRY_TO_REGION.get(country_code, FALLBACK_REGION)
 
 
 def validate_no_duplicate_codes() -> None:
     """Raise ValueError if any country code appears in more than one group."""
-    seen: dict[str, str] = {}
-    all_entries: list[tuple[str, str]] = []
-
-    for code, region in FEATURED.items():
-        all_entries.append((code, region))
-    for region, codes in REGION_GROUPS.items():
-        for code in codes:
-            all_entries.append((code, region))
-
-    for code, region in all_entries:
-        if code in seen:
-            raise ValueError(
-                f"Duplicate country code '{code}': found in '{seen[code]}' and '{region}'"
-            )
-        seen[code] = region
+    _build_country_to_region()
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import os
+import sys
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -74,6 +75,11 @@ async def lifespan(app: FastAPI):
         scheduler.shutdown(wait=False)
         logger.info("Scheduler stopped")
 
+        # Only if a short-term run has loaded the engine (avoids importing sklearn here)
+        short_term = sys.modules.get("app.engine.short_term")
+        if short_term is not None:
+            short_term.shutdown_cluster_pool()
+
 
 app = FastAPI(
     title="Social Listening System",
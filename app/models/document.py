@@ -1,11 +1,14 @@
-import json
 from datetime import datetime
+from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Index, Integer, String, Text
+from sqlalchemy import DateTime, Float, Index, Integer, LargeBinary, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class Document(Base):
     __tablename__ = "documents"
@@ -23,23 +26,43 @@ class Document(Base):
     sentiment: Mapped[str] = mapped_column(String(3), nullable=False)  # pos/neu/neg
     intensity: Mapped[int] = mapped_column(Integer, nullable=False)
     summary_cn: Mapped[str | None] = mapped_column(Text)  # Chinese summary
-    embedding_json: Mapped[str | None] = mapped_column(Text)  # JSON-serialized vector
+    embedding_bytes: Mapped[bytes | None] = mapped_column(LargeBinary)  # raw float32 vector
+    embedding_i8: Mapped[bytes | None] = mapped_column(LargeBinary)  # int8-quantized vector
+    embedding_scale: Mapped[float | None] = mapped_column(Float)  # embedding ≈ embedding_i8 * scale
     engagement_count: Mapped[int] = mapped_column(Integer, default=0)
 
     __table_args__ = (
         Index("idx_docs_brand_created", "brand", "created_at"),
+        Index("idx_docs_created_at", "created_at"),  # short-term window scan across brands
         Index("idx_docs_country", "country_code"),
     )
 
     @property
-    def embedding(self) -> list[float] | None:
-        if self.embedding_json is None:
+    def embedding(self) -> "np.ndarray | None":
+        """Zero-copy, unit-normalized float32 view over embedding_bytes."""
+        if self.embedding_bytes is None:
             return None
-        return json.loads(self.embedding_json)
+
+        import numpy as np
+
+        return np.frombuffer(self.embedding_bytes, dtype=np.float32)
 
     @embedding.setter
-    def embedding(self, value: list[float] | None) -> None:
+    def embedding(self, value: "list[float] | np.ndarray | None") -> None:
+        # Keep the unit-normalized float32 vector (so cosine is a plain dot
+        # product downstream) plus a symmetric per-vector int8 quantization
         if value is None:
-            self.embedding_json = None
+            self.embedding_bytes = None
+            self.embedding_i8 = None
+            self.embedding_scale = None
         else:
-            self.embedding_json = json.dumps(value)
+            import numpy as np
+
+            vector = np.ascontiguousarray(value, dtype=np.float32)
+            norm = float(np.linalg.norm(vector))
+            if norm > 0:
+                vector = vector / norm
+            scale = float(np.abs(vector).max(initial=0.0)) / 127 or 1.0
+            self.embedding_bytes = vector.tobytes()
+            self.embedding_i8 = np.round(vector / scale).astype(np.int8).tobytes()
+            self.embedding_scale = scale
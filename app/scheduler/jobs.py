@@ -29,6 +29,9 @@ def _run_short_term():
                 await run_short_term_engine(session)
         _run_async(_task())
         logger.info("Short-term engine completed")
+    except asyncio.CancelledError:
+        # Clustering was cancelled by shutdown_cluster_pool() during app shutdown
+        logger.warning("Short-term engine cancelled")
     except Exception:
         logger.exception("Short-term engine failed")
 
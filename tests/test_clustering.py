@@ -0,0 +1,29 @@
+import numpy as np
+
+from app.config import settings
+from app.engine.clustering import cluster_embeddings
+
+
+def _unit_rows(m: np.ndarray) -> np.ndarray:
+    return (m / np.linalg.norm(m, axis=1, keepdims=True)).astype(np.float32)
+
+
+def test_groups_tight_cluster_and_leaves_outliers_as_noise():
+    rng = np.random.default_rng(42)
+    dim = 64
+    base = rng.normal(size=dim)
+    tight = base + rng.normal(scale=0.1, size=(settings.MIN_CLUSTER_SIZE + 2, dim))
+    outliers = rng.normal(size=(4, dim))
+    embeddings = _unit_rows(np.vstack([tight, outliers]))
+    doc_ids = [f"t{i}" for i in range(len(tight))] + [f"o{i}" for i in range(len(outliers))]
+
+    clusters = cluster_embeddings(embeddings, doc_ids)
+
+    assert len(clusters) == 1
+    assert sorted(clusters[0]["doc_ids"]) == sorted(doc_ids[:len(tight)])
+    assert clusters[0]["centroid"].shape == (dim,)
+
+
+def test_too_few_documents_returns_no_clusters():
+    embeddings = _unit_rows(np.ones((settings.MIN_CLUSTER_SIZE - 1, 8)))
+    assert cluster_embeddings(embeddings, [str(i) for i in range(len(embeddings))]) == []
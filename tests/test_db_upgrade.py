@@ -0,0 +1,65 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import Session
+
+from app.db.session import upgrade_schema
+from app.models import Base, Document
+
+# documents table as created before embeddings moved to raw bytes
+_LEGACY_DOCUMENTS_DDL = """
+CREATE TABLE documents (
+    doc_id VARCHAR(255) PRIMARY KEY,
+    brand VARCHAR(100) NOT NULL,
+    platform VARCHAR(50) NOT NULL,
+    created_at DATETIME NOT NULL,
+    country_code VARCHAR(2) NOT NULL,
+    region_group VARCHAR(50) NOT NULL,
+    language VARCHAR(10) NOT NULL,
+    text_clean TEXT NOT NULL,
+    topic_l1 VARCHAR(100),
+    aspect VARCHAR(100),
+    sentiment VARCHAR(3) NOT NULL,
+    intensity INTEGER NOT NULL,
+    summary_cn TEXT,
+    embedding_json TEXT,
+    engagement_count INTEGER
+)
+"""
+
+
+def test_upgrade_adds_columns_and_backfills_legacy_embeddings():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text(_LEGACY_DOCUMENTS_DDL))
+        conn.execute(text(
+            "INSERT INTO documents (doc_id, brand, platform, created_at, country_code, region_group, "
+            "language, text_clean, sentiment, intensity, embedding_json) VALUES "
+            "('legacy', 'b', 'reddit', '2026-01-01 00:00:00', 'US', 'GLOBAL', 'en', 'hi', 'neu', 1, '[1.0, 2.0, 2.0]')"
+        ))
+        Base.metadata.create_all(conn)
+        upgrade_schema(conn)
+        # Idempotent on an already-upgraded schema
+        upgrade_schema(conn)
+
+        inspector = inspect(conn)
+        columns = {col["name"] for col in inspector.get_columns("documents")}
+        assert {"embedding_bytes", "embedding_i8", "embedding_scale"} <= columns
+        indexes = {idx["name"] for idx in inspector.get_indexes("documents")}
+        assert "idx_docs_created_at" in indexes
+
+    with Session(engine) as session:
+        legacy = session.get(Document, "legacy")
+        assert legacy.embedding.tolist() == pytest.approx([1 / 3, 2 / 3, 2 / 3])
+        assert np.frombuffer(legacy.embedding_i8, dtype=np.int8).tolist() == [64, 127, 127]
+        assert legacy.embedding_scale == pytest.approx(2 / 3 / 127)
+
+        session.add(Document(
+            doc_id="d1", brand="b", platform="reddit", created_at=datetime(2026, 1, 1),
+            country_code="US", region_group="GLOBAL", language="en", text_clean="hi",
+            sentiment="neu", intensity=1, embedding=[3.0, 4.0],
+        ))
+        session.commit()
+        assert session.get(Document, "d1").embedding.tolist() == pytest.approx([0.6, 0.8])
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from app.engine.event_matcher import _I8_SCREEN_MARGIN, _i8_centroid
+from app.models.document import Document
+
+
+def _unit(v: np.ndarray) -> np.ndarray:
+    return v / np.linalg.norm(v)
+
+
+def test_setter_stores_unit_vector():
+    doc = Document(embedding=[3.0, 4.0, 0.0])
+    assert doc.embedding.dtype == np.float32
+    assert doc.embedding.tolist() == pytest.approx([0.6, 0.8, 0.0])
+    assert float(np.linalg.norm(doc.embedding)) == pytest.approx(1.0)
+    assert np.frombuffer(doc.embedding_i8, dtype=np.int8).tolist() == [95, 127, 0]
+
+
+def test_zero_vector_stays_zero():
+    doc = Document(embedding=[0.0, 0.0, 0.0])
+    assert doc.embedding.tolist() == [0.0, 0.0, 0.0]
+    assert np.frombuffer(doc.embedding_i8, dtype=np.int8).tolist() == [0, 0, 0]
+    assert doc.embedding_scale == 1.0
+
+
+def test_setter_none_clears_all_columns():
+    doc = Document(embedding=[1.0, 2.0])
+    doc.embedding = None
+    assert doc.embedding is None
+    assert doc.embedding_i8 is None and doc.embedding_scale is None
+
+
+def test_i8_centroid_within_screen_margin():
+    rng = np.random.default_rng(0)
+    base = rng.normal(size=768)
+    docs = [Document(embedding=base + rng.normal(scale=0.5, size=768)) for _ in range(20)]
+
+    exact = _unit(np.mean([d.embedding for d in docs], axis=0))
+    approx = _unit(_i8_centroid([d.embedding_i8 for d in docs], [d.embedding_scale for d in docs]))
+
+    assert float(exact @ approx) > 1 - _I8_SCREEN_MARGIN
+    for query in (_unit(base), _unit(rng.normal(size=768))):
+        assert abs(float(query @ exact) - float(query @ approx)) < _I8_SCREEN_MARGIN
@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from sqlalchemy import event as sa_event
+
+from app.engine import event_matcher
+from app.engine.event_matcher import find_matching_event
+from app.models import Document, Event, EventDoc
+
+
+def _add_event(session, event_id: str, updated: datetime, embedding: np.ndarray) -> Event:
+    event = Event(
+        event_id=event_id, brand="A", event_type="A", severity="P2", status="open",
+        start_time=updated, last_update_time=updated, cluster_size=1, neg_ratio=0.0,
+    )
+    session.add_all([
+        event,
+        Document(
+            doc_id=f"{event_id}-doc", brand="A", platform="reddit", created_at=updated,
+            country_code="JP", region_group="JAPAN", language="en", text_clean="text",
+            sentiment="neg", intensity=1, embedding=embedding,
+        ),
+        EventDoc(event_id=event_id, doc_id=f"{event_id}-doc"),
+    ])
+    return event
+
+
+async def test_tie_goes_to_most_recently_updated_event(session):
+    now = datetime.now(timezone.utc)
+    embedding = np.linspace(1.0, 2.0, 16)
+    events = [
+        _add_event(session, "older", now - timedelta(hours=3), embedding),
+        _add_event(session, "newer", now - timedelta(hours=1), embedding),
+    ]
+    await session.flush()
+
+    match = await find_matching_event(embedding, [], events, session)
+
+    assert match is not None and match.event_id == "newer"
+
+
+async def test_best_exact_match_wins_over_int8_screening_order(session, monkeypatch):
+    now = datetime.now(timezone.utc)
+    query = np.zeros(16)
+    query[0] = 1.0
+    close, exact = query.copy(), query.copy()
+    close[1] = 0.5  # cos ≈ 0.894
+    exact[1] = 0.1  # cos ≈ 0.995
+    events = [
+        _add_event(session, "close", now - timedelta(hours=1), close),
+        _add_event(session, "exact", now - timedelta(hours=2), exact),
+    ]
+    await session.flush()
+
+    # Make screening rank "close" above "exact" (both still within the margin)
+    def misleading_centroid(blobs, scales):
+        v = np.frombuffer(blobs[0], dtype=np.int8).astype(np.float32)
+        return query if v[1] > 50 else close
+    monkeypatch.setattr(event_matcher, "_i8_centroid", misleading_centroid)
+
+    selects = []
+    sa_event.listen(
+        session.bind.sync_engine, "before_cursor_execute",
+        lambda conn, cursor, statement, *args: selects.append(statement) if statement.startswith("SELECT") else None,
+    )
+
+    match = await find_matching_event(query, [], events, session)
+
+    assert match is not None and match.event_id == "exact"
+    # One int8 screening query plus one exact-centroid query for all shortlisted events
+    assert len(selects) == 2
@@ -1,5 +1,8 @@
+import pytest
+
+from app.geo import mappings
 from app.geo.classifier import classify_country
-from app.geo.mappings import FALLBACK_REGION, validate_no_duplicate_codes
+from app.geo.mappings import FALLBACK_REGION, get_region, validate_no_duplicate_codes
 
 
 def test_featured_countries():
@@ -25,6 +28,20 @@ def test_case_insensitive():
     assert classify_country("jp")["region_group"] == "JAPAN"
 
 
+def test_get_region_expects_canonical_codes():
+    # get_region does no case folding; classify_country normalizes first
+    assert get_region("JP") == "JAPAN"
+    assert get_region("SG") == "SEA_OTHER"
+    assert get_region("jp") == FALLBACK_REGION
+    assert get_region(" JP") == FALLBACK_REGION
+
+
 def test_no_duplicate_codes():
     # Should not raise
     validate_no_duplicate_codes()
+
+
+def test_duplicate_code_raises(monkeypatch):
+    monkeypatch.setitem(mappings.REGION_GROUPS, "SEA_OTHER", ["SG", "CN"])
+    with pytest.raises(ValueError, match="'CN'"):
+        validate_no_duplicate_codes()
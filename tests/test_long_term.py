@@ -0,0 +1,68 @@
+from datetime import date, datetime, timezone
+
+from sqlalchemy import select
+
+from app.engine.long_term import run_long_term_engine
+from app.models import DailyAspectMetrics, DailyMetrics, Document
+
+TARGET = date(2026, 3, 1)
+
+
+def _doc(doc_id: str, brand: str, sentiment: str, aspect: str | None = None, hour: int = 10) -> Document:
+    return Document(
+        doc_id=doc_id, brand=brand, platform="reddit",
+        created_at=datetime(TARGET.year, TARGET.month, TARGET.day, hour, tzinfo=timezone.utc),
+        country_code="US", region_group="GLOBAL", language="en", text_clean="text",
+        aspect=aspect, sentiment=sentiment, intensity=1,
+    )
+
+
+async def test_counts_and_upsert_in_place(session):
+    session.add_all([
+        _doc("a1", "A", "pos", "refund"),
+        _doc("a2", "A", "neg", "refund"),
+        _doc("a3", "A", "neg", "delay"),
+        _doc("b1", "B", "neu"),
+    ])
+    await session.commit()
+
+    await run_long_term_engine(session, TARGET)
+
+    daily = {m.brand: m for m in (await session.execute(select(DailyMetrics))).scalars()}
+    assert (daily["A"].volume_total, daily["A"].pos_count, daily["A"].neu_count, daily["A"].neg_count) == (3, 1, 0, 2)
+    assert (daily["B"].volume_total, daily["B"].pos_count, daily["B"].neu_count, daily["B"].neg_count) == (1, 0, 1, 0)
+    aspects = {(m.brand, m.aspect): (m.volume, m.neg_count)
+               for m in (await session.execute(select(DailyAspectMetrics))).scalars()}
+    assert aspects == {("A", "refund"): (2, 1), ("A", "delay"): (1, 1)}
+    first_ids = {m.brand: m.id for m in daily.values()}
+
+    # Re-run the same date with one more negative refund doc: rows update in place
+    session.add(_doc("a4", "A", "neg", "refund", hour=11))
+    await session.commit()
+    await run_long_term_engine(session, TARGET)
+    session.expire_all()
+
+    rows = (await session.execute(select(DailyMetrics))).scalars().all()
+    assert len(rows) == 2
+    daily = {m.brand: m for m in rows}
+    assert {m.brand: m.id for m in rows} == first_ids
+    assert (daily["A"].volume_total, daily["A"].neg_count) == (4, 3)
+    aspect_rows = (await session.execute(select(DailyAspectMetrics))).scalars().all()
+    assert len(aspect_rows) == 2
+    assert {(m.brand, m.aspect): (m.volume, m.neg_count) for m in aspect_rows} == {
+        ("A", "refund"): (3, 2), ("A", "delay"): (1, 1),
+    }
+
+
+async def test_ignores_other_days(session):
+    session.add(_doc("x1", "A", "pos", hour=10))
+    session.add(Document(
+        doc_id="x2", brand="A", platform="reddit", created_at=datetime(2026, 3, 2, 1, tzinfo=timezone.utc),
+        country_code="US", region_group="GLOBAL", language="en", text_clean="t", sentiment="neg", intensity=1,
+    ))
+    await session.commit()
+
+    await run_long_term_engine(session, TARGET)
+
+    (row,) = (await session.execute(select(DailyMetrics))).scalars().all()
+    assert (row.volume_total, row.pos_count, row.neg_count) == (1, 1, 0)
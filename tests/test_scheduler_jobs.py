@@ -0,0 +1,17 @@
+import asyncio
+import logging
+
+from app.engine import short_term
+from app.scheduler.jobs import _run_short_term
+
+
+def test_cancelled_short_term_run_is_logged_not_raised(monkeypatch, caplog):
+    async def cancelled(session):
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(short_term, "run_short_term_engine", cancelled)
+
+    with caplog.at_level(logging.WARNING, logger="app.scheduler.jobs"):
+        _run_short_term()
+
+    assert "Short-term engine cancelled" in caplog.text
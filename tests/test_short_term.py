@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from sqlalchemy import select
+
+from app.config import settings
+from app.engine.short_term import run_short_term_engine, shutdown_cluster_pool
+from app.models import Document, Event, EventDoc
+
+
+@pytest.fixture(autouse=True)
+def _stop_cluster_pool():
+    yield
+    shutdown_cluster_pool()
+
+
+def _doc(doc_id: str, embedding: np.ndarray, created_at: datetime, sentiment: str = "neg") -> Document:
+    return Document(
+        doc_id=doc_id, brand="A", platform="reddit", created_at=created_at,
+        country_code="JP", region_group="JAPAN", language="en", text_clean="text",
+        sentiment=sentiment, intensity=1, embedding=embedding,
+    )
+
+
+def _event(event_id: str, last_update_time: datetime, status: str = "open") -> Event:
+    return Event(
+        event_id=event_id, brand="A", event_type="A", severity="P2", status=status,
+        start_time=last_update_time, last_update_time=last_update_time, cluster_size=1, neg_ratio=1.0,
+    )
+
+
+async def test_unmatched_loaded_events_move_through_lifecycle(session):
+    now = datetime.now(timezone.utc)
+    rng = np.random.default_rng(7)
+    dim = 32
+    base = rng.normal(size=dim)
+
+    # An active (loaded) event about something unrelated, last updated 2h ago
+    session.add(_event("stale", now - timedelta(hours=2)))
+    session.add(_doc("stale-doc", -base, now - timedelta(hours=3)))
+    session.add(EventDoc(event_id="stale", doc_id="stale-doc"))
+    # An event past the lifecycle window
+    session.add(_event("expired", now - timedelta(hours=settings.EVENT_LIFECYCLE_HOURS + 1), status="monitoring"))
+    # A fresh tight cluster that matches neither
+    for i in range(settings.MIN_CLUSTER_SIZE + 1):
+        session.add(_doc(f"new-{i}", base + rng.normal(scale=0.05, size=dim), now - timedelta(minutes=30)))
+    await session.commit()
+
+    await run_short_term_engine(session)
+    session.expire_all()
+
+    events = {e.event_id: e for e in (await session.execute(select(Event))).scalars()}
+    assert events["stale"].status == "cooling"
+    assert events["expired"].status == "closed"
+    (created,) = [e for e in events.values() if e.event_id not in ("stale", "expired")]
+    assert created.status == "open"
+    assert created.cluster_size == settings.MIN_CLUSTER_SIZE + 1
+    linked = (await session.execute(select(EventDoc.doc_id).where(EventDoc.event_id == created.event_id))).scalars()
+    assert sorted(linked) == sorted(f"new-{i}" for i in range(settings.MIN_CLUSTER_SIZE + 1))